@@ -95,33 +95,21 @@ app.get('/api/status', async (req, res) => {
 app.use(notFoundHandler);
 app.use(errorHandler);
 
-server.listen(port, () => {
+function logStartupBanner(): void {
   console.log(`🚀 Server running on port ${port}`);
-  console.log(`📡 WebSocket server ready`);
-  console.log(`🤖 LLM providers initialized`);
-  console.log(`⚡ Queue service started`);
-  console.log(`🔄 Session management enabled`);
-  console.log(`🎯 Ollama connection pooling active`);
-  console.log(`🛡️  Error handling and retry logic enabled`);
-});
 
-process.on('SIGTERM', async () => {
-  console.log('Received SIGTERM, shutting down gracefully...');
-  
-  try {
-    await queueService.shutdown();
-    ollamaPoolService.shutdown();
-    server.close();
-    console.log('Server shutdown complete');
-    process.exit(0);
-  } catch (error) {
-    console.error('Error during shutdown:', error);
-    process.exit(1);
+  if (process.env.NODE_ENV !== 'production') {
+    console.log(`📡 WebSocket server ready`);
+    console.log(`🤖 LLM providers initialized`);
+    console.log(`⚡ Queue service started`);
+    console.log(`🔄 Session management enabled`);
+    console.log(`🎯 Ollama connection pooling active`);
+    console.log(`🛡️  Error handling and retry logic enabled`);
   }
-});
+}
 
-process.on('SIGINT', async () => {
-  console.log('Received SIGINT, shutting down gracefully...');
+async function shutdown(signal: NodeJS.Signals): Promise<void> {
+  console.log(`Received ${signal}, shutting down gracefully...`);
   
   try {
     await queueService.shutdown();
@@ -133,4 +121,9 @@ process.on('SIGINT', async () => {
     console.error('Error during shutdown:', error);
     process.exit(1);
   }
-});
\ No newline at end of file
+}
+
+server.listen(port, logStartupBanner);
+
+process.on('SIGTERM', shutdown);
+process.on('SIGINT', shutdown);
@@ -5,45 +5,42 @@ import { Case, Participant, SimulationSettings } from '../types/index.js';
 
 const router = express.Router();
 
+const participantSchema = Joi.object({
+  name: Joi.string().required(),
+  role: Joi.string().valid(
+    'judge', 'prosecutor', 'defense-attorney', 'plaintiff-attorney', 'defendant',
+    'plaintiff', 'witness', 'jury-member', 'court-clerk', 'bailiff'
+  ).required(),
+  description: Joi.string().optional(),
+  aiControlled: Joi.boolean().required(),
+  llmConfig: Joi.object().optional(),
+  emotionalState: Joi.object().pattern(Joi.string(), Joi.number()).optional()
+});
+
+const settingsSchema = Joi.object({
+  realtimeSpeed: Joi.number().min(0.1).max(5).optional(),
+  autoProgress: Joi.boolean().optional(),
+  jurySize: Joi.number().min(0).max(12).optional(),
+  enableObjections: Joi.boolean().optional(),
+  complexityLevel: Joi.string().valid('simple', 'intermediate', 'advanced').optional()
+});
+
 const caseSchema = Joi.object({
   title: Joi.string().required().min(1).max(200),
   type: Joi.string().valid('civil', 'criminal').required(),
   summary: Joi.string().required().min(1).max(2000),
-  participants: Joi.array().items(Joi.object({
-    name: Joi.string().required(),
-    role: Joi.string().required(),
-    description: Joi.string().optional(),
-    aiControlled: Joi.boolean().required(),
-    llmConfig: Joi.object().optional()
-  })).min(1),
-  settings: Joi.object({
-    realtimeSpeed: Joi.number().min(0.1).max(5).optional(),
-    autoProgress: Joi.boolean().optional(),
-    jurySize: Joi.number().min(0).max(12).optional(),
-    enableObjections: Joi.boolean().optional(),
-    complexityLevel: Joi.string().valid('simple', 'intermediate', 'advanced').optional()
-  }).optional()
+  participants: Joi.array().items(participantSchema).min(1),
+  settings: settingsSchema.optional()
 });
 
 const updateCaseSchema = Joi.object({
   title: Joi.string().min(1).max(200).optional(),
   type: Joi.string().valid('civil', 'criminal').optional(),
   summary: Joi.string().min(1).max(2000).optional(),
-  participants: Joi.array().items(Joi.object({
-    id: Joi.string().optional(),
-    name: Joi.string().required(),
-    role: Joi.string().required(),
-    description: Joi.string().optional(),
-    aiControlled: Joi.boolean().required(),
-    llmConfig: Joi.object().optional()
+  participants: Joi.array().items(participantSchema.keys({
+    id: Joi.string().optional()
   })).optional(),
-  settings: Joi.object({
-    realtimeSpeed: Joi.number().min(0.1).max(5).optional(),
-    autoProgress: Joi.boolean().optional(),
-    jurySize: Joi.number().min(0).max(12).optional(),
-    enableObjections: Joi.boolean().optional(),
-    complexityLevel: Joi.string().valid('simple', 'intermediate', 'advanced').optional()
-  }).optional()
+  settings: settingsSchema.optional()
 });
 
 export default function createCaseRoutes(caseService: CaseService) {
@@ -151,9 +148,16 @@ export default function createCaseRoutes(caseService: CaseService) {
   router.post('/:id/participants', async (req, res) => {
     try {
       const { id } = req.params;
-      const participant = req.body;
+      const { error, value } = participantSchema.validate(req.body);
+      
+      if (error) {
+        return res.status(400).json({ 
+          error: 'Validation error', 
+          details: error.details.map(d => d.message) 
+        });
+      }
       
-      const updatedCase = await caseService.addParticipant(id, participant);
+      const updatedCase = await caseService.addParticipant(id, value);
       
       if (!updatedCase) {
         return res.status(404).json({ error: 'Case not found' });
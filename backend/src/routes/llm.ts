@@ -20,7 +20,8 @@ const llmRequestSchema = Joi.object({
     maxTokens: Joi.number().min(1).max(8000).optional()
   }).required(),
   priority: Joi.number().min(0).max(10).optional().default(0),
-  sessionId: Joi.string().optional()
+  sessionId: Joi.string().optional(),
+  noCache: Joi.boolean().optional()
 });
 
 export default function createLLMRoutes(llmService: LLMService, queueService: QueueService) {
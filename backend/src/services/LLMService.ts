@@ -2,6 +2,19 @@ import { LLMConfig, LLMMessage, LLMResponse } from '../types/index.js';
 import OpenAI from 'openai';
 import { Ollama } from 'ollama';
 import axios from 'axios';
+import { Agent as HttpsAgent } from 'https';
+import { createHash } from 'crypto';
+import { toOllamaPrompt } from '../utils/ollamaPrompt.js';
+
+const RESPONSE_CACHE_MAX_ENTRIES = 1024;
+
+// Keys can be listed via getCachedProviders, so only a digest of the credential goes into them
+function hashApiKey(apiKey?: string): string {
+  return apiKey ? createHash('sha256').update(apiKey).digest('hex').slice(0, 16) : 'default';
+}
+
+// Shared by the axios-based providers so API calls reuse pooled TLS connections
+const keepAliveAgent = new HttpsAgent({ keepAlive: true, maxSockets: 8 });
 
 export abstract class BaseLLMProvider {
   protected config: LLMConfig;
@@ -12,6 +25,14 @@ export abstract class BaseLLMProvider {
 
   abstract generateResponse(messages: LLMMessage[]): Promise<LLMResponse>;
   abstract validateConfig(): Promise<boolean>;
+
+  // Providers without native streaming yield the whole completion as a single chunk.
+  // The generator's return value is the token usage, when the provider reports it.
+  async *streamResponse(messages: LLMMessage[]): AsyncGenerator<string, LLMResponse['usage'], unknown> {
+    const response = await this.generateResponse(messages);
+    yield response.content;
+    return response.usage;
+  }
 }
 
 export class OpenAIProvider extends BaseLLMProvider {
@@ -47,6 +68,36 @@ export class OpenAIProvider extends BaseLLMProvider {
     }
   }
 
+  async *streamResponse(messages: LLMMessage[]): AsyncGenerator<string, LLMResponse['usage'], unknown> {
+    const stream = await this.client.chat.completions.create({
+      model: this.config.model || 'gpt-4-turbo-preview',
+      messages: messages as any,
+      temperature: this.config.temperature || 0.7,
+      max_tokens: this.config.maxTokens || 1000,
+      stream: true,
+      stream_options: { include_usage: true },
+    });
+
+    let usage: LLMResponse['usage'];
+
+    for await (const chunk of stream) {
+      const token = chunk.choices[0]?.delta?.content;
+      if (token) {
+        yield token;
+      }
+
+      if (chunk.usage) {
+        usage = {
+          promptTokens: chunk.usage.prompt_tokens,
+          completionTokens: chunk.usage.completion_tokens,
+          totalTokens: chunk.usage.total_tokens,
+        };
+      }
+    }
+
+    return usage;
+  }
+
   async validateConfig(): Promise<boolean> {
     try {
       await this.client.models.list();
@@ -86,6 +137,7 @@ export class AnthropicProvider extends BaseLLMProvider {
             'anthropic-version': '2023-06-01',
             'content-type': 'application/json',
           },
+          httpsAgent: keepAliveAgent,
         }
       );
 
@@ -130,11 +182,12 @@ export class OllamaProvider extends BaseLLMProvider {
 
   async generateResponse(messages: LLMMessage[]): Promise<LLMResponse> {
     try {
-      const prompt = messages.map(m => `${m.role}: ${m.content}`).join('\\n');
+      const { system, prompt } = toOllamaPrompt(messages);
       
       const response = await this.client.generate({
         model: this.config.model || 'llama2',
         prompt: prompt,
+        system: system,
         options: {
           temperature: this.config.temperature || 0.7,
           num_predict: this.config.maxTokens || 1000,
@@ -150,6 +203,40 @@ export class OllamaProvider extends BaseLLMProvider {
     }
   }
 
+  async *streamResponse(messages: LLMMessage[]): AsyncGenerator<string, LLMResponse['usage'], unknown> {
+    const { system, prompt } = toOllamaPrompt(messages);
+
+    const stream = await this.client.generate({
+      model: this.config.model || 'llama2',
+      prompt: prompt,
+      system: system,
+      stream: true,
+      options: {
+        temperature: this.config.temperature || 0.7,
+        num_predict: this.config.maxTokens || 1000,
+      },
+    });
+
+    for await (const chunk of stream) {
+      if (chunk.response) {
+        yield chunk.response;
+      }
+
+      if (chunk.done) {
+        // prompt_eval_count is omitted when the prompt is served from Ollama's KV cache
+        const promptTokens = chunk.prompt_eval_count ?? 0;
+        const completionTokens = chunk.eval_count ?? 0;
+        return {
+          promptTokens,
+          completionTokens,
+          totalTokens: promptTokens + completionTokens,
+        };
+      }
+    }
+
+    return undefined;
+  }
+
   async validateConfig(): Promise<boolean> {
     try {
       await this.client.list();
@@ -186,6 +273,7 @@ export class OpenRouterProvider extends BaseLLMProvider {
             'HTTP-Referer': 'https://courtroom-simulator.com',
             'X-Title': 'Courtroom Simulator',
           },
+          httpsAgent: keepAliveAgent,
         }
       );
 
@@ -241,6 +329,7 @@ export class GroqProvider extends BaseLLMProvider {
             'Authorization': `Bearer ${this.apiKey}`,
             'Content-Type': 'application/json',
           },
+          httpsAgent: keepAliveAgent,
         }
       );
 
@@ -274,9 +363,12 @@ export class GroqProvider extends BaseLLMProvider {
 
 export class LLMService {
   private providers: Map<string, BaseLLMProvider> = new Map();
+  private responseCache: Map<string, LLMResponse> = new Map();
 
   createProvider(config: LLMConfig): BaseLLMProvider {
-    const key = `${config.provider}_${config.model}_${config.endpoint || 'default'}`;
+    // Credentials and sampling settings are baked into each provider, so they must be part of the key;
+    // getResponseCacheKey hashes the same fields so cached responses match the provider that made them
+    const key = `${config.provider}_${config.model}_${config.endpoint || 'default'}_${hashApiKey(config.apiKey)}_${config.temperature}_${config.maxTokens}`;
     
     if (this.providers.has(key)) {
       return this.providers.get(key)!;
@@ -308,6 +400,52 @@ export class LLMService {
     return provider;
   }
 
+  async generateResponse(
+    config: LLMConfig,
+    messages: LLMMessage[],
+    options: { noCache?: boolean } = {}
+  ): Promise<LLMResponse> {
+    const provider = this.createProvider(config);
+
+    if (options.noCache) {
+      return provider.generateResponse(messages);
+    }
+
+    const key = this.getResponseCacheKey(config, messages);
+    const cached = this.responseCache.get(key);
+    if (cached) {
+      return cached;
+    }
+
+    const response = await provider.generateResponse(messages);
+
+    // Map preserves insertion order, so the first key is the oldest entry
+    if (this.responseCache.size >= RESPONSE_CACHE_MAX_ENTRIES) {
+      const oldestKey = this.responseCache.keys().next().value;
+      if (oldestKey !== undefined) {
+        this.responseCache.delete(oldestKey);
+      }
+    }
+    this.responseCache.set(key, response);
+
+    return response;
+  }
+
+  private getResponseCacheKey(config: LLMConfig, messages: LLMMessage[]): string {
+    return createHash('sha256')
+      .update(JSON.stringify({
+        provider: config.provider,
+        model: config.model,
+        endpoint: config.endpoint,
+        apiKey: hashApiKey(config.apiKey),
+        temperature: config.temperature,
+        maxTokens: config.maxTokens,
+        // Prompts that differ only in whitespace share a cache entry
+        messages: messages.map(m => ({ role: m.role, content: m.content.replace(/\s+/g, ' ').trim() }))
+      }))
+      .digest('hex');
+  }
+
   async getProviderStatus(): Promise<Record<string, any>> {
     const status: Record<string, any> = {};
 
@@ -354,6 +492,7 @@ export class LLMService {
 
   clearCache(): void {
     this.providers.clear();
+    this.responseCache.clear();
   }
 
   getCachedProviders(): string[] {
@@ -1,5 +1,6 @@
 import { Ollama } from 'ollama';
 import { LLMConfig, LLMMessage, LLMResponse } from '../types/index.js';
+import { toOllamaPrompt } from '../utils/ollamaPrompt.js';
 
 interface OllamaInstance {
   id: string;
@@ -140,11 +141,12 @@ export class OllamaPoolService {
     instance.activeRequests++;
     
     try {
-      const prompt = messages.map(m => `${m.role}: ${m.content}`).join('\\n');
+      const { system, prompt } = toOllamaPrompt(messages);
       
       const response = await instance.client.generate({
         model: config.model,
         prompt: prompt,
+        system: system,
         options: {
           temperature: config.temperature || 0.7,
           num_predict: config.maxTokens || 1000,
@@ -177,11 +179,12 @@ export class OllamaPoolService {
     instance.activeRequests++;
     
     try {
-      const prompt = messages.map(m => `${m.role}: ${m.content}`).join('\\n');
+      const { system, prompt } = toOllamaPrompt(messages);
       
       const stream = await instance.client.generate({
         model: config.model,
         prompt: prompt,
+        system: system,
         stream: true,
         options: {
           temperature: config.temperature || 0.7,
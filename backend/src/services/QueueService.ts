@@ -9,8 +9,11 @@ interface QueueJob {
   createdAt: Date;
   attempts: number;
   maxAttempts: number;
+  notBefore?: number;
 }
 
+const RETRY_DELAY_MS = 1000;
+
 export class QueueService extends EventEmitter {
   private queue: QueueJob[] = [];
   private processing = false;
@@ -47,9 +50,14 @@ export class QueueService extends EventEmitter {
 
     this.emit('job_queued', request.id, this.queue.length);
     console.log(`Job ${request.id} added to queue. Queue length: ${this.queue.length}`);
+
+    // Dispatch on the next tick so callers can announce the job before it starts
+    setImmediate(() => this.processQueue());
   }
 
   async getQueuePosition(requestId: string): Promise<number> {
+    if (this.activeJobs.has(requestId)) return 0;
+
     const index = this.queue.findIndex(job => job.id === requestId);
     return index >= 0 ? index + 1 : -1;
   }
@@ -81,15 +89,22 @@ export class QueueService extends EventEmitter {
     }, 1000);
   }
 
-  private async processQueue(): Promise<void> {
-    if (this.activeJobs.size >= this.maxConcurrent || this.queue.length === 0) {
-      return;
-    }
+  private processQueue(): void {
+    // Fill every free slot at once so concurrent jobs overlap their LLM round-trips
+    while (this.processing && this.activeJobs.size < this.maxConcurrent) {
+      const now = Date.now();
+      const index = this.queue.findIndex(job => !job.notBefore || job.notBefore <= now);
+      if (index < 0) return;
 
-    const job = this.queue.shift();
-    if (!job) return;
+      const [job] = this.queue.splice(index, 1);
+      if (!job) return;
 
-    this.activeJobs.set(job.id, job);
+      this.activeJobs.set(job.id, job);
+      this.runJob(job).finally(() => this.processQueue());
+    }
+  }
+
+  private async runJob(job: QueueJob): Promise<void> {
     job.request.status = 'processing';
     job.attempts++;
 
@@ -122,12 +137,16 @@ export class QueueService extends EventEmitter {
         this.emit('job_failed', job.id, errorMessage);
         console.log(`Job ${job.id} permanently failed after ${job.attempts} attempts`);
       } else {
+        const delay = RETRY_DELAY_MS * job.attempts;
+
         this.activeJobs.delete(job.id);
         job.priority += 1;
+        job.notBefore = Date.now() + delay;
         this.queue.push(job);
         this.queue.sort((a, b) => b.priority - a.priority);
+        setTimeout(() => this.processQueue(), delay);
         
-        console.log(`Job ${job.id} requeued for retry (attempt ${job.attempts + 1}/${job.maxAttempts})`);
+        console.log(`Job ${job.id} requeued for retry in ${delay}ms (attempt ${job.attempts + 1}/${job.maxAttempts})`);
       }
     }
   }
@@ -138,12 +157,12 @@ export class QueueService extends EventEmitter {
     }
 
     const { request } = job;
-    const provider = this.llmService.createProvider(request.config);
-    
     this.emit('job_progress', job.id, 0.1);
 
     const startTime = Date.now();
-    const response = await provider.generateResponse(request.messages);
+    const response = await this.llmService.generateResponse(request.config, request.messages, {
+      noCache: request.noCache
+    });
     const endTime = Date.now();
 
     this.emit('job_progress', job.id, 1.0);
@@ -199,6 +218,7 @@ export class QueueService extends EventEmitter {
     this.failedJobs.delete(requestId);
     
     failedJob.attempts = 0;
+    failedJob.notBefore = undefined;
     failedJob.request.status = 'pending';
     failedJob.request.error = undefined;
     failedJob.request.result = undefined;
@@ -1,7 +1,9 @@
 import { Server as SocketIOServer, Socket } from 'socket.io';
-import { LLMService } from './LLMService.js';
+import { LLMService, BaseLLMProvider } from './LLMService.js';
 import { QueueService } from './QueueService.js';
-import { WebSocketMessage, LLMRequest } from '../types/index.js';
+import { WebSocketMessage, LLMRequest, LLMMessage } from '../types/index.js';
+
+const STREAM_FLUSH_INTERVAL_MS = 30;
 
 export class WebSocketService {
   private io: SocketIOServer;
@@ -83,7 +85,7 @@ export class WebSocketService {
 
   private async handleLLMRequest(socket: Socket, data: any): Promise<void> {
     try {
-      const { messages, config, priority = 0, sessionId } = data;
+      const { messages, config, priority = 0, sessionId, noCache } = data;
       
       if (!messages || !config) {
         socket.emit('llm_error', { error: 'Invalid request: missing messages or config' });
@@ -97,6 +99,7 @@ export class WebSocketService {
         priority,
         userId: socket.id,
         sessionId,
+        noCache,
         timestamp: new Date(),
         status: 'pending'
       };
@@ -134,24 +137,7 @@ export class WebSocketService {
       });
 
       const provider = this.llmService.createProvider(config);
-      
-      if (config.provider === 'ollama') {
-        await this.streamOllamaResponse(socket, requestId, provider, messages);
-      } else {
-        const response = await provider.generateResponse(messages);
-        
-        socket.emit('llm_stream', {
-          requestId,
-          content: response.content,
-          usage: response.usage,
-          timestamp: new Date().toISOString()
-        });
-
-        socket.emit('llm_stream_end', {
-          requestId,
-          timestamp: new Date().toISOString()
-        });
-      }
+      await this.streamProviderResponse(socket, requestId, provider, messages);
 
     } catch (error) {
       console.error('Error handling streaming LLM request:', error);
@@ -162,42 +148,59 @@ export class WebSocketService {
     }
   }
 
-  private async streamOllamaResponse(socket: Socket, requestId: string, provider: any, messages: any[]): Promise<void> {
-    try {
-      const prompt = messages.map(m => `${m.role}: ${m.content}`).join('\\n');
-      
-      const stream = await provider.client.generate({
-        model: provider.config.model || 'llama2',
-        prompt: prompt,
-        stream: true,
-        options: {
-          temperature: provider.config.temperature || 0.7,
-          num_predict: provider.config.maxTokens || 1000,
-        },
-      });
+  private async streamProviderResponse(
+    socket: Socket,
+    requestId: string,
+    provider: BaseLLMProvider,
+    messages: LLMMessage[]
+  ): Promise<void> {
+    let flushTimer: ReturnType<typeof setTimeout> | undefined;
 
+    try {
       let fullContent = '';
+      let pending = '';
+      let lastFlush = 0;
+
+      const flush = () => {
+        clearTimeout(flushTimer);
+        flushTimer = undefined;
 
-      for await (const chunk of stream) {
-        if (chunk.response) {
-          fullContent += chunk.response;
-          socket.emit('llm_stream', {
-            requestId,
-            chunk: chunk.response,
-            content: fullContent,
-            done: chunk.done || false,
-            timestamp: new Date().toISOString()
-          });
+        if (pending) {
+          socket.emit('llm_stream', { requestId, chunk: pending });
+          pending = '';
+          lastFlush = Date.now();
         }
+      };
 
-        if (chunk.done) {
-          break;
+      // Forward tokens as they arrive; clients concatenate chunks themselves.
+      // Chunk events stay minimal since they fire at token rate; start/end carry timestamps.
+      // Tokens arriving within STREAM_FLUSH_INTERVAL_MS of the last emit are coalesced into one event;
+      // a timer flushes them if the model stalls before the next token arrives.
+      // Iterate by hand rather than with for-await so the generator's return value (usage) isn't discarded.
+      const stream = provider.streamResponse(messages);
+      let next = await stream.next();
+
+      while (!next.done) {
+        const chunk = next.value;
+        fullContent += chunk;
+        pending += chunk;
+
+        const elapsed = Date.now() - lastFlush;
+        if (elapsed >= STREAM_FLUSH_INTERVAL_MS) {
+          flush();
+        } else if (!flushTimer) {
+          flushTimer = setTimeout(flush, STREAM_FLUSH_INTERVAL_MS - elapsed);
         }
+
+        next = await stream.next();
       }
 
+      flush();
+
       socket.emit('llm_stream_end', {
         requestId,
         finalContent: fullContent,
+        usage: next.value,
         timestamp: new Date().toISOString()
       });
 
@@ -206,6 +209,8 @@ export class WebSocketService {
         requestId,
         error: error instanceof Error ? error.message : 'Streaming failed'
       });
+    } finally {
+      clearTimeout(flushTimer);
     }
   }
 
@@ -28,6 +28,7 @@ export interface LLMRequest {
   priority?: number;
   userId?: string;
   sessionId?: string;
+  noCache?: boolean;
   timestamp: Date;
   status: 'pending' | 'processing' | 'completed' | 'failed';
   result?: LLMResponse;
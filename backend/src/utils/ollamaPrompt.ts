@@ -0,0 +1,9 @@
+import { LLMMessage } from '../types/index.js';
+
+// Persona/system text goes in Ollama's system field so the prompt prefix stays stable turn to turn
+export function toOllamaPrompt(messages: LLMMessage[]): { system?: string; prompt: string } {
+  return {
+    system: messages.find(m => m.role === 'system')?.content,
+    prompt: messages.filter(m => m.role !== 'system').map(m => `${m.role}: ${m.content}`).join('\\n'),
+  };
+}
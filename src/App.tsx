@@ -20,9 +20,6 @@ function App() {
   const handleCaseGenerate = async (caseType: string, category: 'criminal' | 'civil') => {
     setIsGenerating(true);
     try {
-      // Add delay to show loading state
-      await new Promise(resolve => setTimeout(resolve, 1000));
-      
       // Generate case based on type and category
       const realisticCase = CaseScenarioFactory.generateReplacementCase(caseType, category);
     
@@ -1,6 +1,22 @@
 import { getWebSocketClient, LLMRequest, LLMResponse } from './WebSocketClient';
 import { LLMProvider, LLMMessage, LLMResponse as BaseLLMResponse } from '../types';
-import { v4 as uuidv4 } from 'uuid';
+import { mapWithConcurrency } from '../utils/async';
+
+const BATCH_CONCURRENCY = 5;
+
+// crypto.randomUUID only exists in secure contexts (HTTPS or localhost); when the app is
+// served over plain HTTP on a LAN address, build an RFC 4122 v4 id from getRandomValues instead
+function generateRequestId(): string {
+  if (typeof crypto.randomUUID === 'function') {
+    return crypto.randomUUID();
+  }
+
+  const bytes = crypto.getRandomValues(new Uint8Array(16));
+  bytes[6] = (bytes[6] & 0x0f) | 0x40;
+  bytes[8] = (bytes[8] & 0x3f) | 0x80;
+  const hex = Array.from(bytes, b => b.toString(16).padStart(2, '0')).join('');
+  return `${hex.slice(0, 8)}-${hex.slice(8, 12)}-${hex.slice(12, 16)}-${hex.slice(16, 20)}-${hex.slice(20)}`;
+}
 
 export interface BackendLLMConfig {
   useBackend: boolean;
@@ -108,7 +124,7 @@ export class BackendLLMService {
     const systemMessage = messages.find(m => m.role === 'system')?.content;
 
     const request: LLMRequest = {
-      id: uuidv4(),
+      id: generateRequestId(),
       provider: provider,
       prompt: prompt,
       system: systemMessage,
@@ -218,27 +234,17 @@ export class BackendLLMService {
   ): Promise<BaseLLMResponse[]> {
     console.log(`📊 Processing batch of ${requests.length} LLM requests`);
 
-    // Process in parallel with a concurrency limit
-    const concurrencyLimit = 5;
-    const results: BaseLLMResponse[] = [];
-
-    for (let i = 0; i < requests.length; i += concurrencyLimit) {
-      const batch = requests.slice(i, i + concurrencyLimit);
-      const batchResults = await Promise.all(
-        batch.map(req =>
-          this.generateResponse(req.messages, req.provider, req.options).catch(error => {
-            console.error('Batch request failed:', error);
-            return {
-              content: 'Error generating response',
-              provider: req.provider,
-              model: 'unknown',
-              usage: { promptTokens: 0, completionTokens: 0, totalTokens: 0 },
-            };
-          })
-        )
-      );
-      results.push(...batchResults);
-    }
+    const results = await mapWithConcurrency(requests, BATCH_CONCURRENCY, req =>
+      this.generateResponse(req.messages, req.provider, req.options).catch((error): BaseLLMResponse => {
+        console.error('Batch request failed:', error);
+        return {
+          content: 'Error generating response',
+          provider: req.provider,
+          model: 'unknown',
+          usage: { promptTokens: 0, completionTokens: 0, totalTokens: 0 },
+        };
+      })
+    );
 
     console.log(`✅ Batch processing complete: ${results.length} responses`);
     return results;
@@ -258,7 +264,7 @@ export class BackendLLMService {
       throw new Error('Backend not connected for streaming');
     }
 
-    const requestId = uuidv4();
+    const requestId = generateRequestId();
     const chunks: string[] = [];
 
     // Set up streaming listener
@@ -37,6 +37,10 @@ export interface CaseScenario {
 }
 
 export class CaseScenarioFactory {
+  // Scenario tables are static data; build them once instead of on every case generation.
+  // Selectors hand out deep copies so a generated case can never mutate the shared tables.
+  private static criminalScenarioCache: CaseScenario[] | null = null;
+  private static civilScenarioCache: CaseScenario[] | null = null;
 
   /**
    * Generate replacement case based on type
@@ -80,7 +84,7 @@ export class CaseScenarioFactory {
       type: 'civil',
       legalSystem: 'common-law',
       summary: scenario.narrative.summary,
-      facts: scenario.narrative.detailedFacts,
+      facts: [...scenario.narrative.detailedFacts],
       civil: {
         baseType: 'civil',
         causeOfAction: scenario.legalIssues.chargesOrClaims[0] || 'negligence',
@@ -152,7 +156,7 @@ export class CaseScenarioFactory {
       type: 'criminal',
       legalSystem: 'common-law',
       summary: scenario.narrative.summary,
-      facts: scenario.narrative.detailedFacts,
+      facts: [...scenario.narrative.detailedFacts],
       criminal: {
         baseType: 'criminal',
         charges: charges,
@@ -162,7 +166,7 @@ export class CaseScenarioFactory {
         investigatingAgency: ['NYPD', 'Detective Bureau'],
         defendantCustodyStatus: Math.random() > 0.3 ? 'released-bail' : 'remanded',
         bailAmount: Math.floor(Math.random() * 100000) + 10000,
-        priorConvictions: scenario.narrative.criminalHistory || [],
+        priorConvictions: [...(scenario.narrative.criminalHistory || [])],
         grandJuryIndictment: charges.some(c => c.classification.includes('Felony')),
         plea: 'not-guilty',
         sentencingGuidelines: 'New York State Sentencing Guidelines',
@@ -188,18 +192,18 @@ export class CaseScenarioFactory {
    * Select a case scenario based on type or randomly
    */
   private static selectCaseScenario(caseType?: string): CaseScenario {
-    const scenarios = this.getCaseScenarios();
+    const scenarios = this.criminalScenarioCache ??= this.getCaseScenarios();
     
     if (caseType) {
       const filteredScenarios = scenarios.filter(s => 
         s.basicInfo.title.toLowerCase().includes(caseType.toLowerCase())
       );
       if (filteredScenarios.length > 0) {
-        return filteredScenarios[Math.floor(Math.random() * filteredScenarios.length)];
+        return structuredClone(filteredScenarios[Math.floor(Math.random() * filteredScenarios.length)]);
       }
     }
     
-    return scenarios[Math.floor(Math.random() * scenarios.length)];
+    return structuredClone(scenarios[Math.floor(Math.random() * scenarios.length)]);
   }
 
   /**
@@ -840,7 +844,7 @@ export class CaseScenarioFactory {
    * Generate civil case scenarios
    */
   private static selectCivilCaseScenario(caseType?: string): CaseScenario {
-    const civilScenarios = this.getCivilScenarios();
+    const civilScenarios = this.civilScenarioCache ??= this.getCivilScenarios();
     
     if (caseType) {
       const filteredScenarios = civilScenarios.filter(s => 
@@ -848,11 +852,11 @@ export class CaseScenarioFactory {
         s.legalIssues.chargesOrClaims.some(c => c.toLowerCase().includes(caseType.toLowerCase()))
       );
       if (filteredScenarios.length > 0) {
-        return filteredScenarios[Math.floor(Math.random() * filteredScenarios.length)];
+        return structuredClone(filteredScenarios[Math.floor(Math.random() * filteredScenarios.length)]);
       }
     }
     
-    return civilScenarios[Math.floor(Math.random() * civilScenarios.length)];
+    return structuredClone(civilScenarios[Math.floor(Math.random() * civilScenarios.length)]);
   }
 
   /**
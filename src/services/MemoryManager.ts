@@ -378,7 +378,7 @@ export class MemoryManager {
   }
 
   public exportMemory(): JudgeMemory {
-    return JSON.parse(JSON.stringify(this.memory));
+    return structuredClone(this.memory);
   }
 
   public importMemory(memory: JudgeMemory): void {
@@ -683,7 +683,7 @@ export class OptimizedMemoryManager {
   }
 
   public exportMemory(): JudgeMemory {
-    return JSON.parse(JSON.stringify(this.memory));
+    return structuredClone(this.memory);
   }
 
   public importMemory(memory: JudgeMemory): void {
@@ -23,6 +23,9 @@ import { EnhancedJudgeProfile } from '../types/judge';
 import { TestimonyGenerator, TestimonySequence } from './TestimonyGenerator';
 import { DetailedWitness } from './WitnessFactory';
 import { OfficeManager, OfficeManagerCallbacks } from './OfficeManager';
+import { mapWithConcurrency, withTimeout } from '../utils/async';
+
+const JURY_DELIBERATION_CONCURRENCY = 3;
 
 export interface ProceedingEvent {
   type: 'speech' | 'objection' | 'ruling' | 'evidence' | 'phase-change' | 'sidebar' | 'recess';
@@ -136,12 +139,9 @@ export class ProceedingsEngine {
     if (handler) {
       try {
         console.log(`🎬 Starting phase: ${this.currentCase.currentPhase}`);
-        await Promise.race([
-          handler(),
-          new Promise<void>((_, reject) => 
-            setTimeout(() => reject(new Error(`Phase ${this.currentCase.currentPhase} timeout`)), 120000)
-          )
-        ]);
+        await withTimeout(handler(), 120000, () => {
+          throw new Error(`Phase ${this.currentCase.currentPhase} timeout`);
+        });
         console.log(`✅ Completed phase: ${this.currentCase.currentPhase}`);
       } catch (error) {
         console.error(`❌ Error in phase ${this.currentCase.currentPhase}:`, error);
@@ -271,12 +271,9 @@ export class ProceedingsEngine {
 
     try {
       console.log('Starting pre-trial motions handling');
-      await Promise.race([
-        this.handleMotions(),
-        new Promise<void>((_, reject) => 
-          setTimeout(() => reject(new Error('Motions timeout')), 30000)
-        )
-      ]);
+      await withTimeout(this.handleMotions(), 30000, () => {
+        throw new Error('Motions timeout');
+      });
       console.log('Completed pre-trial motions');
     } catch (error) {
       console.error('Skipping motions due to error:', error);
@@ -441,40 +438,44 @@ export class ProceedingsEngine {
     
     const prosecutor = this.findParticipantByRole('prosecutor') || 
                       this.findParticipantByRole('plaintiff-attorney');
-    if (prosecutor) {
-      const agent = this.agents.get(prosecutor.id);
-      if (agent) {
+    const defense = this.findParticipantByRole('defense-attorney');
+    const prosecutorAgent = prosecutor ? this.agents.get(prosecutor.id) : undefined;
+    const defenseAgent = defense ? this.agents.get(defense.id) : undefined;
+    
+    // Neither opening depends on the other's text, so both prompts are known up front
+    let prosecutorPrompt: string;
+    let defensePrompt: string;
+    if (this.currentCase.type === 'criminal') {
+      prosecutorPrompt = `Opening statement for criminal prosecution. Explain how the evidence will prove beyond a reasonable doubt that defendant committed the charged crimes: ${this.currentCase.summary}. Remind jury of the high burden of proof and that defendant is presumed innocent.`;
+      defensePrompt = `Defense opening statement for criminal case. Emphasize presumption of innocence, burden of proof beyond reasonable doubt, and holes in prosecution's case: ${this.currentCase.summary}. Remind jury they must acquit if any reasonable doubt exists.`;
+    } else {
+      prosecutorPrompt = `Opening statement for civil plaintiff. Explain how the evidence will prove by a preponderance of evidence that defendant is liable for damages: ${this.currentCase.summary}. Outline the damages sought and legal theories.`;
+      defensePrompt = `Defense opening statement for civil case. Challenge plaintiff's evidence and damages claims: ${this.currentCase.summary}. Explain why defendant should not be held liable or why damages are excessive.`;
+    }
+    
+    if (prosecutor && defense && prosecutorAgent && defenseAgent) {
+      // Both sides are AI-controlled: prepare the openings concurrently, then deliver them in order
+      this.aiCallbacks?.setAIProcessing(true, `${prosecutor.name} and ${defense.name} preparing opening statements`);
+      
+      const [prosecutorStatement, defenseStatement] = await Promise.all([
+        this.prepareOpeningStatement(prosecutorAgent, 'Preparing opening statement', prosecutorPrompt),
+        this.prepareOpeningStatement(defenseAgent, 'Preparing defense opening statement', defensePrompt),
+      ]);
+      
+      await this.generateAndRecordStatement(prosecutor, prosecutorStatement);
+      await this.generateAndRecordStatement(defense, defenseStatement);
+      this.aiCallbacks?.setAIProcessing(false);
+    } else {
+      if (prosecutor && prosecutorAgent) {
         this.aiCallbacks?.setAIProcessing(true, `${prosecutor.name} preparing opening statement`);
-        await agent.think('Preparing opening statement');
-        
-        let prompt: string;
-        if (this.currentCase.type === 'criminal') {
-          prompt = `Opening statement for criminal prosecution. Explain how the evidence will prove beyond a reasonable doubt that defendant committed the charged crimes: ${this.currentCase.summary}. Remind jury of the high burden of proof and that defendant is presumed innocent.`;
-        } else {
-          prompt = `Opening statement for civil plaintiff. Explain how the evidence will prove by a preponderance of evidence that defendant is liable for damages: ${this.currentCase.summary}. Outline the damages sought and legal theories.`;
-        }
-        
-        const statement = await agent.generateStatement(prompt);
+        const statement = await this.prepareOpeningStatement(prosecutorAgent, 'Preparing opening statement', prosecutorPrompt);
         await this.generateAndRecordStatement(prosecutor, statement);
         this.aiCallbacks?.setAIProcessing(false);
       }
-    }
-    
-    const defense = this.findParticipantByRole('defense-attorney');
-    if (defense) {
-      const agent = this.agents.get(defense.id);
-      if (agent) {
+      
+      if (defense && defenseAgent) {
         this.aiCallbacks?.setAIProcessing(true, `${defense.name} preparing defense opening statement`);
-        await agent.think('Preparing defense opening statement');
-        
-        let prompt: string;
-        if (this.currentCase.type === 'criminal') {
-          prompt = `Defense opening statement for criminal case. Emphasize presumption of innocence, burden of proof beyond reasonable doubt, and holes in prosecution's case: ${this.currentCase.summary}. Remind jury they must acquit if any reasonable doubt exists.`;
-        } else {
-          prompt = `Defense opening statement for civil case. Challenge plaintiff's evidence and damages claims: ${this.currentCase.summary}. Explain why defendant should not be held liable or why damages are excessive.`;
-        }
-        
-        const statement = await agent.generateStatement(prompt);
+        const statement = await this.prepareOpeningStatement(defenseAgent, 'Preparing defense opening statement', defensePrompt);
         await this.generateAndRecordStatement(defense, statement);
         this.aiCallbacks?.setAIProcessing(false);
       }
@@ -483,6 +484,11 @@ export class ProceedingsEngine {
     this.transitionToPhase('plaintiff-case');
   }
 
+  private async prepareOpeningStatement(agent: CourtroomAgent, thought: string, prompt: string): Promise<string> {
+    await agent.think(thought);
+    return agent.generateStatement(prompt);
+  }
+
   private async handlePlaintiffCase(): Promise<void> {
     await this.announcePhase("Plaintiff's Case");
     
@@ -603,28 +609,31 @@ export class ProceedingsEngine {
       standardDescription = 'beyond a reasonable doubt';
     }
     
-    this.aiCallbacks?.setAIProcessing(true, 'Jury deliberating');
+    const deliberatingJurors = juryMembers.slice(0, this.settings.jurySize);
+    let jurorsFinished = 0;
+    this.aiCallbacks?.setAIProcessing(true, `${deliberatingJurors.length} jurors deliberating on evidence`);
     this.aiCallbacks?.setAIProgress(0, juryMembers.length);
     
-    for (let i = 0; i < juryMembers.slice(0, this.settings.jurySize).length; i++) {
-      const juror = juryMembers[i];
+    const deliberate = async (juror: Participant): Promise<void> => {
       const agent = this.agents.get(juror.id);
-      if (agent) {
-        this.aiCallbacks?.setAIProcessing(true, `Juror ${i + 1} deliberating on evidence`);
-        
-        // Each juror considers the evidence against the burden of proof
-        await agent.think(`Deliberating on evidence presented. Must decide if ${this.currentCase.type === 'criminal' ? 'prosecution' : 'plaintiff'} has proven their case ${standardDescription}.`);
-        
-        const evidenceStrength = this.evaluateEvidenceStrength();
-        const personalBias = (juror.personality.analyticalThinking + juror.personality.conscientiousness) / 20;
-        const adjustedStrength = evidenceStrength + personalBias - 0.05; // Slight random factor
-        
-        votes.set(juror.id, adjustedStrength > threshold);
-        this.aiCallbacks?.setAIProgress(i + 1, this.settings.jurySize);
-        
-        await this.delay(500 / this.settings.realtimeSpeed); // Deliberation time
-      }
-    }
+      if (!agent) return;
+      
+      // Each juror considers the evidence against the burden of proof
+      await agent.think(`Deliberating on evidence presented. Must decide if ${this.currentCase.type === 'criminal' ? 'prosecution' : 'plaintiff'} has proven their case ${standardDescription}.`);
+      
+      const evidenceStrength = this.evaluateEvidenceStrength();
+      const personalBias = (juror.personality.analyticalThinking + juror.personality.conscientiousness) / 20;
+      const adjustedStrength = evidenceStrength + personalBias - 0.05; // Slight random factor
+      
+      votes.set(juror.id, adjustedStrength > threshold);
+      this.aiCallbacks?.setAIProgress(++jurorsFinished, this.settings.jurySize);
+      
+      await this.delay(500 / this.settings.realtimeSpeed); // Deliberation time
+    };
+    
+    // Jurors weigh the evidence independently, so they deliberate concurrently; a small
+    // window keeps a local model (which serves requests mostly serially) from being flooded
+    await mapWithConcurrency(deliberatingJurors, JURY_DELIBERATION_CONCURRENCY, deliberate);
     
     const favorableVotes = Array.from(votes.values()).filter(v => v).length;
     const unfavorableVotes = this.settings.jurySize - favorableVotes;
@@ -1000,24 +1009,22 @@ export class ProceedingsEngine {
         let questionPrompt = this.generateDirectExamPrompt(witness, examiner, i);
         
         try {
-          const question = await Promise.race([
+          const question = await withTimeout(
             agent.generateStatement(questionPrompt),
-            new Promise<string>((resolve) => 
-              setTimeout(() => resolve(this.getFallbackQuestion(witness, examiner, i)), 10000)
-            )
-          ]);
+            10000,
+            () => this.getFallbackQuestion(witness, examiner, i)
+          );
           
           await this.generateAndRecordStatement(examiner, question);
           
           // Generate realistic witness answer
           let answerPrompt = this.generateWitnessAnswerPrompt(witness, examiner, question, i);
           
-          const answer = await Promise.race([
+          const answer = await withTimeout(
             witnessAgent.generateStatement(answerPrompt),
-            new Promise<string>((resolve) => 
-              setTimeout(() => resolve(this.getFallbackAnswer(witness, i)), 10000)
-            )
-          ]);
+            10000,
+            () => this.getFallbackAnswer(witness, i)
+          );
           
           await this.generateAndRecordStatement(witness, answer);
           
@@ -1050,24 +1057,22 @@ export class ProceedingsEngine {
         let questionPrompt = this.generateCrossExamPrompt(witness, examiner, i);
         
         try {
-          const question = await Promise.race([
+          const question = await withTimeout(
             agent.generateStatement(questionPrompt),
-            new Promise<string>((resolve) => 
-              setTimeout(() => resolve(this.getFallbackCrossQuestion(witness, examiner, i)), 10000)
-            )
-          ]);
+            10000,
+            () => this.getFallbackCrossQuestion(witness, examiner, i)
+          );
           
           await this.generateAndRecordStatement(examiner, question);
           
           // Generate defensive witness answer for cross-examination
           let answerPrompt = this.generateCrossAnswerPrompt(witness, examiner, question, i);
           
-          const answer = await Promise.race([
+          const answer = await withTimeout(
             witnessAgent.generateStatement(answerPrompt),
-            new Promise<string>((resolve) => 
-              setTimeout(() => resolve(this.getFallbackCrossAnswer(witness, i)), 10000)
-            )
-          ]);
+            10000,
+            () => this.getFallbackCrossAnswer(witness, i)
+          );
           
           await this.generateAndRecordStatement(witness, answer);
           
@@ -1501,12 +1506,11 @@ export class ProceedingsEngine {
         
         Provide specific legal reasoning explaining why you ${ruling.decision} this motion, citing relevant law and applying it to the facts of this case. Be thorough but concise.`;
         
-        const detailedRuling = await Promise.race([
+        const detailedRuling = await withTimeout(
           agent.generateStatement(rulingPrompt),
-          new Promise<string>((resolve) => 
-            setTimeout(() => resolve(`After careful consideration of the arguments and applicable law, the court ${ruling.decision} the ${motion.title}. ${ruling.legal_reasoning}`), 15000)
-          )
-        ]);
+          15000,
+          () => `After careful consideration of the arguments and applicable law, the court ${ruling.decision} the ${motion.title}. ${ruling.legal_reasoning}`
+        );
         
         return detailedRuling;
       } catch (error) {
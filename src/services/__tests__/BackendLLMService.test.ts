@@ -0,0 +1,81 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { BackendLLMService } from '../BackendLLMService';
+import type { LLMMessage } from '../llm/LLMProvider';
+
+vi.mock('../WebSocketClient', () => ({
+  getWebSocketClient: vi.fn(),
+}));
+
+describe('BackendLLMService', () => {
+  let service: BackendLLMService;
+
+  beforeEach(() => {
+    service = new BackendLLMService({ useBackend: false, fallbackToLocal: true });
+    vi.spyOn(console, 'log').mockImplementation(() => {});
+    vi.spyOn(console, 'error').mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
+  describe('Batch Generation', () => {
+    const makeRequest = (prompt: string) => ({
+      messages: [{ role: 'user', content: prompt }] as LLMMessage[],
+      provider: 'ollama' as const,
+    });
+
+    it('should return results in request order despite uneven latencies and failures', async () => {
+      const latencies: Record<string, number> = { a: 40, b: 5, c: 25, d: 0, e: 15, f: 30, g: 10 };
+      const events: string[] = [];
+      let inFlight = 0;
+      let maxInFlight = 0;
+
+      vi.spyOn(service, 'generateResponse').mockImplementation(async (messages) => {
+        const prompt = messages[0].content;
+        events.push(`start:${prompt}`);
+        inFlight++;
+        maxInFlight = Math.max(maxInFlight, inFlight);
+        await new Promise(resolve => setTimeout(resolve, latencies[prompt]));
+        inFlight--;
+        events.push(`end:${prompt}`);
+
+        if (prompt === 'c') {
+          throw new Error('provider unavailable');
+        }
+
+        return {
+          content: `response ${prompt}`,
+          provider: 'ollama',
+          model: 'llama2',
+        } as any;
+      });
+
+      const prompts = ['a', 'b', 'c', 'd', 'e', 'f', 'g'];
+      const results = await service.generateBatch(prompts.map(makeRequest));
+
+      expect(results.map(r => r.content)).toEqual([
+        'response a',
+        'response b',
+        'Error generating response',
+        'response d',
+        'response e',
+        'response f',
+        'response g',
+      ]);
+      expect(results[2].provider).toBe('ollama');
+      expect(maxInFlight).toBe(5);
+      // Sliding window: queued requests start as soon as any slot frees up,
+      // rather than waiting for the slowest request in a fixed group of five
+      expect(events.indexOf('start:f')).toBeLessThan(events.indexOf('end:a'));
+      expect(events.indexOf('start:g')).toBeLessThan(events.indexOf('end:a'));
+    });
+
+    it('should handle an empty batch', async () => {
+      const generateSpy = vi.spyOn(service, 'generateResponse');
+
+      await expect(service.generateBatch([])).resolves.toEqual([]);
+      expect(generateSpy).not.toHaveBeenCalled();
+    });
+  });
+});
@@ -0,0 +1,38 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { CaseScenarioFactory } from '../CaseScenarioFactory';
+
+describe('CaseScenarioFactory', () => {
+  afterEach(() => {
+    vi.clearAllMocks();
+  });
+
+  describe('Scenario Isolation', () => {
+    it('should not leak edits to a generated criminal case into later cases', () => {
+      const first = CaseScenarioFactory.generateNYSCriminalCase('Marcus Williams');
+      const originalTitle = (first as any).scenario.basicInfo.title;
+      const originalFacts = [...(first as any).scenario.narrative.detailedFacts];
+
+      (first as any).scenario.basicInfo.title = 'Edited title';
+      (first as any).scenario.narrative.detailedFacts.push('Edited fact');
+      first.facts.push('Another edited fact');
+
+      const second = CaseScenarioFactory.generateNYSCriminalCase('Marcus Williams');
+
+      expect((second as any).scenario.basicInfo.title).toBe(originalTitle);
+      expect((second as any).scenario.narrative.detailedFacts).toEqual(originalFacts);
+      expect(second.facts).toEqual(originalFacts);
+    });
+
+    it('should not leak edits to a generated civil case into later cases', () => {
+      const first = CaseScenarioFactory.generateReplacementCase(undefined, 'civil');
+      const originalFacts = [...first.facts];
+
+      first.facts.push('Edited fact');
+
+      const second = CaseScenarioFactory.generateReplacementCase(first.title, 'civil');
+
+      expect(second.title).toBe(first.title);
+      expect(second.facts).toEqual(originalFacts);
+    });
+  });
+});
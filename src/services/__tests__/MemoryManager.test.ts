@@ -300,6 +300,32 @@ describe('MemoryManager', () => {
       expect(newMemoryManager.getParticipantHistory(mockParticipant.name)).toBeDefined();
     });
 
+    it('should keep timestamps as Dates so cleanup works after export and import', () => {
+      memoryManager.recordCase(mockCase, 'guilty', ['event']);
+
+      const exportedMemory = memoryManager.exportMemory();
+      expect(exportedMemory.cases[0].timestamp).toBeInstanceOf(Date);
+
+      const oldDate = new Date();
+      oldDate.setDate(oldDate.getDate() - 2000); // Older than retention period
+      exportedMemory.cases.push({
+        ...exportedMemory.cases[0],
+        caseId: 'old-case',
+        timestamp: oldDate
+      });
+
+      // The export is a copy; editing it must not touch the source manager
+      expect(memoryManager.getCaseHistory()).toHaveLength(1);
+
+      const newMemoryManager = new MemoryManager('test-judge-2');
+      newMemoryManager.importMemory(exportedMemory);
+      newMemoryManager.cleanupOldCases();
+
+      const remainingCases = newMemoryManager.getCaseHistory();
+      expect(remainingCases).toHaveLength(1);
+      expect(remainingCases[0].caseId).toBe(mockCase.id);
+    });
+
     it('should provide memory statistics', () => {
       memoryManager.recordCase(mockCase, 'guilty', []);
       memoryManager.recordParticipantInteraction(mockParticipant, 'conviction', 'good');
@@ -192,6 +192,148 @@ describe('ProceedingsEngine', () => {
     });
   });
 
+  describe('Opening Statements', () => {
+    const defenseAttorney = (aiControlled: boolean): Participant => ({
+      id: 'defense-1',
+      name: 'Attorney Lee',
+      role: 'defense-attorney',
+      aiControlled,
+      personality: {
+        assertiveness: 7,
+        empathy: 7,
+        analyticalThinking: 8,
+        emotionalStability: 7,
+        openness: 6,
+        conscientiousness: 8,
+        persuasiveness: 8,
+      },
+      background: {
+        age: 38,
+        education: 'JD from Columbia',
+        experience: '12 years in criminal defense',
+        personalHistory: 'Former public defender',
+        motivations: ['Due process'],
+      },
+      currentMood: 0.7,
+      knowledge: ['Criminal Defense'],
+      objectives: ['Acquittal'],
+    } as Participant);
+
+    const setUpOpenings = (defenseAIControlled: boolean) => {
+      const openingCase = { ...mockCase, participants: [...mockCase.participants, defenseAttorney(defenseAIControlled)], transcript: [] };
+      const openingEngine = new ProceedingsEngine(openingCase, mockSettings, mockAICallbacks);
+      (openingEngine as any).delay = vi.fn().mockResolvedValue(undefined);
+
+      const events: string[] = [];
+      for (const id of ['prosecutor-1', 'defense-1']) {
+        const agent = (openingEngine as any).agents.get(id);
+        if (!agent) continue;
+        agent.think = vi.fn().mockResolvedValue([]);
+        agent.generateStatement = vi.fn(async () => {
+          events.push(`generate:${id}`);
+          await new Promise(resolve => setTimeout(resolve, 5));
+          return `Opening from ${id}`;
+        });
+      }
+
+      const record = (openingEngine as any).generateAndRecordStatement.bind(openingEngine);
+      (openingEngine as any).generateAndRecordStatement = vi.fn(async (speaker: Participant, content: string) => {
+        events.push(`record:${speaker.id}`);
+        return record(speaker, content);
+      });
+
+      return { openingCase, openingEngine, events };
+    };
+
+    it('should prepare both AI openings concurrently and record them in order', async () => {
+      const { openingCase, openingEngine, events } = setUpOpenings(true);
+
+      await (openingEngine as any).handleOpeningStatements();
+
+      const firstRecord = events.indexOf('record:prosecutor-1');
+      expect(events.indexOf('generate:prosecutor-1')).toBeLessThan(firstRecord);
+      expect(events.indexOf('generate:defense-1')).toBeLessThan(firstRecord);
+
+      const openings = openingCase.transcript.filter(entry => entry.content.startsWith('Opening from'));
+      expect(openings.map(entry => entry.role)).toEqual(['prosecutor', 'defense-attorney']);
+      expect(openingEngine.getCurrentPhase()).toBe('plaintiff-case');
+    });
+
+    it('should fall back to the sequential path when only one side is AI-controlled', async () => {
+      const { openingCase, openingEngine, events } = setUpOpenings(false);
+
+      await (openingEngine as any).handleOpeningStatements();
+
+      expect(events.filter(event => event.startsWith('generate:'))).toEqual(['generate:prosecutor-1']);
+      expect(mockAICallbacks.setAIProcessing).toHaveBeenCalledWith(true, 'DA Johnson preparing opening statement');
+
+      const openings = openingCase.transcript.filter(entry => entry.content.startsWith('Opening from'));
+      expect(openings.map(entry => entry.role)).toEqual(['prosecutor']);
+    });
+  });
+
+  describe('Jury Deliberation', () => {
+    const createJuror = (index: number): Participant => ({
+      id: `juror-${index}`,
+      name: `Juror ${index}`,
+      role: 'jury-member',
+      aiControlled: true,
+      personality: {
+        assertiveness: 5,
+        empathy: 5,
+        analyticalThinking: 5,
+        emotionalStability: 5,
+        openness: 5,
+        conscientiousness: 5,
+        persuasiveness: 5,
+      },
+      background: {
+        age: 30 + index,
+        education: 'High school',
+        experience: 'Retail manager',
+        personalHistory: 'Local resident',
+        motivations: ['Civic duty'],
+      },
+      currentMood: 0.5,
+      knowledge: [],
+      objectives: ['Reach a fair verdict'],
+    } as Participant);
+
+    it('should have every juror vote once with bounded concurrency', async () => {
+      const jurors = Array.from({ length: mockSettings.jurySize }, (_, i) => createJuror(i));
+      const juryCase = { ...mockCase, participants: [...mockCase.participants, ...jurors], rulings: [] };
+      const juryEngine = new ProceedingsEngine(juryCase, mockSettings, mockAICallbacks);
+      (juryEngine as any).delay = vi.fn().mockResolvedValue(undefined);
+
+      const thinkCalls: string[] = [];
+      let inFlight = 0;
+      let maxInFlight = 0;
+
+      for (const juror of jurors) {
+        const agent = (juryEngine as any).agents.get(juror.id);
+        agent.think = vi.fn(async () => {
+          thinkCalls.push(juror.id);
+          inFlight++;
+          maxInFlight = Math.max(maxInFlight, inFlight);
+          await new Promise(resolve => setTimeout(resolve, 5));
+          inFlight--;
+          return [];
+        });
+      }
+
+      await (juryEngine as any).handleJuryDeliberation();
+
+      expect([...thinkCalls].sort()).toEqual(jurors.map(j => j.id).sort());
+      expect(maxInFlight).toBe(3);
+      expect(mockAICallbacks.setAIProgress).toHaveBeenLastCalledWith(mockSettings.jurySize, mockSettings.jurySize);
+
+      const verdict = juryCase.rulings.find(r => r.subject === 'verdict');
+      const votes = verdict!.reasoning.match(/(\d+) guilty, (\d+) not guilty/);
+      expect(Number(votes![1]) + Number(votes![2])).toBe(mockSettings.jurySize);
+      expect(juryEngine.getCurrentPhase()).toBe('verdict');
+    });
+  });
+
   describe('Edge Cases', () => {
     it('should handle case with no participants gracefully', () => {
       const emptyCase = { ...mockCase, participants: [] };
@@ -9,6 +9,242 @@ import {
   ParticipantRole 
 } from '../../types';
 import { BaseLLMProvider, LLMMessage, LLMProviderFactory } from '../llm/LLMProvider';
+import { withTimeout } from '../../utils/async';
+
+const MAX_LONG_TERM_MEMORIES = 64;
+
+const DAILY_ROUTINES: Record<ParticipantRole, string[]> = {
+  'judge': [
+    'Review case files and legal precedents',
+    'Prepare for court proceedings',
+    'Study relevant laws and regulations',
+    'Deliberate on complex legal matters',
+    'Write judicial opinions',
+  ],
+  'prosecutor': [
+    'Review evidence and witness statements',
+    'Prepare opening and closing arguments',
+    'Interview witnesses',
+    'Research case law',
+    'Strategize prosecution approach',
+  ],
+  'defense-attorney': [
+    'Meet with client to discuss case',
+    'Investigate alternative theories',
+    'Prepare cross-examination questions',
+    'Research precedents for defense',
+    'Draft motions and briefs',
+  ],
+  'plaintiff-attorney': [
+    'Gather supporting documentation',
+    'Interview plaintiff and witnesses',
+    'Calculate damages',
+    'Research similar cases',
+    'Prepare exhibits',
+  ],
+  'defendant': [
+    'Reflect on the case',
+    'Prepare testimony',
+    'Consult with attorney',
+    'Manage stress and anxiety',
+    'Maintain hope for favorable outcome',
+  ],
+  'plaintiff': [
+    'Document experiences',
+    'Prepare for testimony',
+    'Gather supporting evidence',
+    'Consult with attorney',
+    'Seek emotional support',
+  ],
+  'witness': [
+    'Review relevant events',
+    'Prepare testimony',
+    'Ensure accuracy of statements',
+    'Manage pre-testimony anxiety',
+    'Coordinate with legal teams',
+  ],
+  'jury-member': [
+    'Listen attentively to proceedings',
+    'Take notes on evidence',
+    'Avoid external influences',
+    'Deliberate with fellow jurors',
+    'Form objective opinions',
+  ],
+  'bailiff': [
+    'Maintain courtroom security',
+    'Assist judge with proceedings',
+    'Manage evidence handling',
+    'Ensure orderly conduct',
+    'Coordinate with court staff',
+  ],
+  'court-clerk': [
+    'Maintain court records',
+    'Manage case files',
+    'Schedule proceedings',
+    'Process legal documents',
+    'Assist with administrative tasks',
+  ],
+  'observer': [
+    'Observe proceedings',
+    'Take notes',
+    'Form opinions',
+    'Discuss with others',
+    'Learn about legal system',
+  ],
+};
+
+// Fallback lines used when no LLM is configured or a call fails
+const DEFAULT_STATEMENTS: Record<ParticipantRole, Record<string, string[]>> = {
+  'judge': {
+    'opening': [
+      'We are now ready to begin this trial. Prosecution, please proceed with your opening statement.',
+      'Ladies and gentlemen of the jury, you will now hear opening statements from both sides.',
+      'Counsel, please present your opening statements to the jury.'
+    ],
+    'closing': [
+      'Ladies and gentlemen of the jury, you will now hear closing arguments from both sides.',
+      'The evidence phase is complete. We proceed to closing arguments.',
+      'Counsel, please present your final arguments to the jury.'
+    ],
+    'motion': [
+      'I have reviewed the motion and supporting papers. Counsel, please present your arguments.',
+      'The court will hear arguments on the pending motion.',
+      'Counsel, please proceed with your motion argument.'
+    ],
+    'default': [
+      'Please proceed with your next witness.',
+      'Sustained. The jury will disregard.',
+      'Overruled. You may continue.',
+      'The objection is noted. Please move on.'
+    ]
+  },
+  'prosecutor': {
+    'opening': [
+      'Ladies and gentlemen of the jury, the evidence in this case will prove beyond a reasonable doubt that the defendant committed the crimes charged.',
+      'Your Honor, members of the jury, at the conclusion of this trial, I will ask you to find the defendant guilty as charged.',
+      'The evidence will show that on the night in question, the defendant\'s actions constituted a clear violation of New York State law.'
+    ],
+    'closing': [
+      'Ladies and gentlemen, the evidence has proven beyond a reasonable doubt that the defendant is guilty of all charges.',
+      'The facts are clear, the evidence is overwhelming, and justice demands a guilty verdict.',
+      'Based on the testimony and evidence presented, we ask you to hold the defendant accountable for these crimes.'
+    ],
+    'witness': [
+      'Officer, please tell the jury what you observed at the scene.',
+      'Can you identify the defendant for the court?',
+      'What did you do next in your investigation?'
+    ],
+    'default': [
+      'Objection, your honor - relevance.',
+      'The People have no further questions.',
+      'We would like to admit this exhibit into evidence.'
+    ]
+  },
+  'defense-attorney': {
+    'opening': [
+      'Ladies and gentlemen of the jury, my client is presumed innocent until proven guilty beyond a reasonable doubt.',
+      'The prosecution\'s case is built on speculation and insufficient evidence. The defense will show reasonable doubt exists.',
+      'At the end of this trial, I will ask you to find my client not guilty because the prosecution has failed to meet their burden.'
+    ],
+    'closing': [
+      'The prosecution has failed to prove guilt beyond a reasonable doubt. You must find my client not guilty.',
+      'The evidence does not support the charges. There is reasonable doubt, and you must acquit.',
+      'Justice requires that you return a verdict of not guilty based on the lack of credible evidence.'
+    ],
+    'witness': [
+      'Isn\'t it true that you didn\'t have a clear view of the events?',
+      'You\'ve changed your story since your initial statement, haven\'t you?',
+      'You cannot be certain of your identification, can you?'
+    ],
+    'default': [
+      'Objection - leading the witness.',
+      'I have no further questions for this witness.',
+      'Your Honor, I move for a directed verdict.'
+    ]
+  },
+  'plaintiff-attorney': {
+    'opening': [
+      'Members of the jury, the evidence will show that the defendant\'s negligence caused significant harm to my client.',
+      'At the conclusion of this trial, we will ask you to hold the defendant accountable for the damages they caused.',
+      'The facts will demonstrate that the defendant breached their duty of care, resulting in serious injury to the plaintiff.'
+    ],
+    'closing': [
+      'The evidence clearly shows the defendant\'s liability. We ask for fair compensation for our client\'s injuries.',
+      'Justice requires that the defendant be held responsible for the harm they caused.',
+      'Based on the evidence, we request that you award damages that fully compensate our client.'
+    ],
+    'witness': [
+      'Please describe for the jury how this incident has affected your life.',
+      'Can you tell us about your medical treatment following the accident?',
+      'What ongoing difficulties do you face as a result of this incident?'
+    ],
+    'default': [
+      'Objection - assumes facts not in evidence.',
+      'We have no further questions.',
+      'I would like to present Plaintiff\'s Exhibit A.'
+    ]
+  },
+  'witness': {
+    'direct': [
+      'I was present at the scene on the night in question.',
+      'I clearly observed what happened.',
+      'Yes, I can identify the person I saw.',
+      'The events occurred just as I described.'
+    ],
+    'cross': [
+      'I\'m telling the truth to the best of my ability.',
+      'I remember the events clearly.',
+      'My testimony today is consistent with what I observed.',
+      'I have no reason to lie about what I saw.'
+    ],
+    'default': [
+      'Yes, that\'s correct.',
+      'No, that did not happen.',
+      'I don\'t recall those specific details.',
+      'To the best of my knowledge, yes.'
+    ]
+  },
+  'defendant': {
+    'testimony': [
+      'I did not commit the crimes I\'m charged with.',
+      'I was not at the location during the time in question.',
+      'I have been honest about my whereabouts that evening.',
+      'The identification is mistaken - it was not me.'
+    ],
+    'default': [
+      'Not guilty, your honor.',
+      'I understand my rights.',
+      'Yes, your honor.',
+      'No, your honor.'
+    ]
+  },
+  'plaintiff': {
+    'testimony': [
+      'The accident has completely changed my life.',
+      'I was not at fault for what happened.',
+      'The pain and suffering has been tremendous.',
+      'I just want to be made whole again.'
+    ],
+    'default': [
+      'Yes, that\'s exactly what happened.',
+      'The defendant was clearly negligent.',
+      'I\'ve suffered significant damages.',
+      'That is correct, your honor.'
+    ]
+  },
+  'jury-member': {
+    'default': ['[Listening attentively]', '[Taking notes]', '[Observing evidence]']
+  },
+  'bailiff': {
+    'default': ['All rise for the Honorable Judge.', 'Please be seated.', 'Order in the court.']
+  },
+  'court-clerk': {
+    'default': ['Case number called.', 'Exhibit marked for identification.', 'So noted by the court.']
+  },
+  'observer': {
+    'default': ['[Observing proceedings silently]']
+  }
+};
 
 export class CourtroomAgent {
   private participant: Participant;
@@ -19,6 +255,8 @@ export class CourtroomAgent {
   private emotionalState: Map<string, number>;
   private dailyRoutine: string[] = [];
   private currentThoughts: string[] = [];
+  private coreMemoryCount: number = 0;
+  private systemPromptCache: string | null = null;
 
   constructor(participant: Participant) {
     this.participant = participant;
@@ -51,6 +289,7 @@ export class CourtroomAgent {
       `My experience: ${this.participant.background.experience}`,
       ...this.participant.background.motivations.map(m => `I am motivated by: ${m}`),
     ];
+    this.coreMemoryCount = this.memory.longTerm.length;
 
     this.memory.beliefs.set('justice', 0.8);
     this.memory.beliefs.set('truth', 0.9);
@@ -60,87 +299,7 @@ export class CourtroomAgent {
   }
 
   private generateDailyRoutine() {
-    const routines: Record<ParticipantRole, string[]> = {
-      'judge': [
-        'Review case files and legal precedents',
-        'Prepare for court proceedings',
-        'Study relevant laws and regulations',
-        'Deliberate on complex legal matters',
-        'Write judicial opinions',
-      ],
-      'prosecutor': [
-        'Review evidence and witness statements',
-        'Prepare opening and closing arguments',
-        'Interview witnesses',
-        'Research case law',
-        'Strategize prosecution approach',
-      ],
-      'defense-attorney': [
-        'Meet with client to discuss case',
-        'Investigate alternative theories',
-        'Prepare cross-examination questions',
-        'Research precedents for defense',
-        'Draft motions and briefs',
-      ],
-      'plaintiff-attorney': [
-        'Gather supporting documentation',
-        'Interview plaintiff and witnesses',
-        'Calculate damages',
-        'Research similar cases',
-        'Prepare exhibits',
-      ],
-      'defendant': [
-        'Reflect on the case',
-        'Prepare testimony',
-        'Consult with attorney',
-        'Manage stress and anxiety',
-        'Maintain hope for favorable outcome',
-      ],
-      'plaintiff': [
-        'Document experiences',
-        'Prepare for testimony',
-        'Gather supporting evidence',
-        'Consult with attorney',
-        'Seek emotional support',
-      ],
-      'witness': [
-        'Review relevant events',
-        'Prepare testimony',
-        'Ensure accuracy of statements',
-        'Manage pre-testimony anxiety',
-        'Coordinate with legal teams',
-      ],
-      'jury-member': [
-        'Listen attentively to proceedings',
-        'Take notes on evidence',
-        'Avoid external influences',
-        'Deliberate with fellow jurors',
-        'Form objective opinions',
-      ],
-      'bailiff': [
-        'Maintain courtroom security',
-        'Assist judge with proceedings',
-        'Manage evidence handling',
-        'Ensure orderly conduct',
-        'Coordinate with court staff',
-      ],
-      'court-clerk': [
-        'Maintain court records',
-        'Manage case files',
-        'Schedule proceedings',
-        'Process legal documents',
-        'Assist with administrative tasks',
-      ],
-      'observer': [
-        'Observe proceedings',
-        'Take notes',
-        'Form opinions',
-        'Discuss with others',
-        'Learn about legal system',
-      ],
-    };
-
-    this.dailyRoutine = routines[this.participant.role] || routines['observer'];
+    this.dailyRoutine = DAILY_ROUTINES[this.participant.role] || DAILY_ROUTINES['observer'];
   }
 
   async think(context: string): Promise<string[]> {
@@ -249,20 +408,6 @@ Generate an appropriate statement for the current courtroom context. Be concise
     return fallbackStatement;
   }
 
-  // Timeout wrapper utility
-  private async withTimeout<T>(
-    promise: Promise<T>, 
-    timeoutMs: number, 
-    timeoutMessage: string
-  ): Promise<T> {
-    return Promise.race([
-      promise,
-      new Promise<T>((_, reject) => 
-        setTimeout(() => reject(new Error(timeoutMessage)), timeoutMs)
-      )
-    ]);
-  }
-
   // Retry wrapper with exponential backoff
   private async withRetry<T>(
     operation: () => Promise<T>,
@@ -276,11 +421,9 @@ Generate an appropriate statement for the current courtroom context. Be concise
       try {
         console.log(`🔄 ${context} - Attempt ${attempt}/${maxAttempts}`);
         
-        const result = await this.withTimeout(
-          operation(),
-          timeoutMs,
-          `${context} timeout on attempt ${attempt}`
-        );
+        const result = await withTimeout(operation(), timeoutMs, () => {
+          throw new Error(`${context} timeout on attempt ${attempt}`);
+        });
         
         if (attempt > 1) {
           console.log(`✅ ${context} - Success on attempt ${attempt}`);
@@ -345,7 +488,7 @@ Should you object? Respond with YES or NO and brief reasoning.`,
     if (this.memory.shortTerm.length > 20) {
       const itemToArchive = this.memory.shortTerm.shift();
       if (itemToArchive && Math.random() > 0.3) {
-        this.memory.longTerm.push(itemToArchive);
+        this.archiveMemory(itemToArchive);
       }
     }
 
@@ -402,6 +545,17 @@ Should you object? Respond with YES or NO and brief reasoning.`,
     }
   }
 
+  private archiveMemory(content: string): void {
+    this.memory.longTerm.push(content);
+    // Long trials would otherwise grow this without bound; drop the oldest archived
+    // entry but keep the identity memories seeded in initializeAgent (the cap always
+    // leaves room for at least one archived entry, however many motivations there are)
+    const limit = Math.max(MAX_LONG_TERM_MEMORIES, this.coreMemoryCount + 1);
+    if (this.memory.longTerm.length > limit) {
+      this.memory.longTerm.splice(this.coreMemoryCount, 1);
+    }
+  }
+
   private updateMemory(content: string): void {
     this.memory.shortTerm.push(content);
     if (this.memory.shortTerm.length > 10) {
@@ -414,6 +568,14 @@ Should you object? Respond with YES or NO and brief reasoning.`,
   }
 
   private buildSystemPrompt(): string {
+    // The persona only depends on the participant's static profile, so build it once
+    if (this.systemPromptCache === null) {
+      this.systemPromptCache = this.renderSystemPrompt();
+    }
+    return this.systemPromptCache;
+  }
+
+  private renderSystemPrompt(): string {
     return `You are ${this.participant.name}, a ${this.participant.role} in a courtroom.
 
 Background:
@@ -464,159 +626,7 @@ Act according to your role and personality. Be professional and follow courtroom
     // Enhanced fallback statements based on context and role
     const contextKey = this.getContextualKey(context);
     
-    const statements: Record<ParticipantRole, Record<string, string[]>> = {
-      'judge': {
-        'opening': [
-          'We are now ready to begin this trial. Prosecution, please proceed with your opening statement.',
-          'Ladies and gentlemen of the jury, you will now hear opening statements from both sides.',
-          'Counsel, please present your opening statements to the jury.'
-        ],
-        'closing': [
-          'Ladies and gentlemen of the jury, you will now hear closing arguments from both sides.',
-          'The evidence phase is complete. We proceed to closing arguments.',
-          'Counsel, please present your final arguments to the jury.'
-        ],
-        'motion': [
-          'I have reviewed the motion and supporting papers. Counsel, please present your arguments.',
-          'The court will hear arguments on the pending motion.',
-          'Counsel, please proceed with your motion argument.'
-        ],
-        'default': [
-          'Please proceed with your next witness.',
-          'Sustained. The jury will disregard.',
-          'Overruled. You may continue.',
-          'The objection is noted. Please move on.'
-        ]
-      },
-      'prosecutor': {
-        'opening': [
-          'Ladies and gentlemen of the jury, the evidence in this case will prove beyond a reasonable doubt that the defendant committed the crimes charged.',
-          'Your Honor, members of the jury, at the conclusion of this trial, I will ask you to find the defendant guilty as charged.',
-          'The evidence will show that on the night in question, the defendant\'s actions constituted a clear violation of New York State law.'
-        ],
-        'closing': [
-          'Ladies and gentlemen, the evidence has proven beyond a reasonable doubt that the defendant is guilty of all charges.',
-          'The facts are clear, the evidence is overwhelming, and justice demands a guilty verdict.',
-          'Based on the testimony and evidence presented, we ask you to hold the defendant accountable for these crimes.'
-        ],
-        'witness': [
-          'Officer, please tell the jury what you observed at the scene.',
-          'Can you identify the defendant for the court?',
-          'What did you do next in your investigation?'
-        ],
-        'default': [
-          'Objection, your honor - relevance.',
-          'The People have no further questions.',
-          'We would like to admit this exhibit into evidence.'
-        ]
-      },
-      'defense-attorney': {
-        'opening': [
-          'Ladies and gentlemen of the jury, my client is presumed innocent until proven guilty beyond a reasonable doubt.',
-          'The prosecution\'s case is built on speculation and insufficient evidence. The defense will show reasonable doubt exists.',
-          'At the end of this trial, I will ask you to find my client not guilty because the prosecution has failed to meet their burden.'
-        ],
-        'closing': [
-          'The prosecution has failed to prove guilt beyond a reasonable doubt. You must find my client not guilty.',
-          'The evidence does not support the charges. There is reasonable doubt, and you must acquit.',
-          'Justice requires that you return a verdict of not guilty based on the lack of credible evidence.'
-        ],
-        'witness': [
-          'Isn\'t it true that you didn\'t have a clear view of the events?',
-          'You\'ve changed your story since your initial statement, haven\'t you?',
-          'You cannot be certain of your identification, can you?'
-        ],
-        'default': [
-          'Objection - leading the witness.',
-          'I have no further questions for this witness.',
-          'Your Honor, I move for a directed verdict.'
-        ]
-      },
-      'plaintiff-attorney': {
-        'opening': [
-          'Members of the jury, the evidence will show that the defendant\'s negligence caused significant harm to my client.',
-          'At the conclusion of this trial, we will ask you to hold the defendant accountable for the damages they caused.',
-          'The facts will demonstrate that the defendant breached their duty of care, resulting in serious injury to the plaintiff.'
-        ],
-        'closing': [
-          'The evidence clearly shows the defendant\'s liability. We ask for fair compensation for our client\'s injuries.',
-          'Justice requires that the defendant be held responsible for the harm they caused.',
-          'Based on the evidence, we request that you award damages that fully compensate our client.'
-        ],
-        'witness': [
-          'Please describe for the jury how this incident has affected your life.',
-          'Can you tell us about your medical treatment following the accident?',
-          'What ongoing difficulties do you face as a result of this incident?'
-        ],
-        'default': [
-          'Objection - assumes facts not in evidence.',
-          'We have no further questions.',
-          'I would like to present Plaintiff\'s Exhibit A.'
-        ]
-      },
-      'witness': {
-        'direct': [
-          'I was present at the scene on the night in question.',
-          'I clearly observed what happened.',
-          'Yes, I can identify the person I saw.',
-          'The events occurred just as I described.'
-        ],
-        'cross': [
-          'I\'m telling the truth to the best of my ability.',
-          'I remember the events clearly.',
-          'My testimony today is consistent with what I observed.',
-          'I have no reason to lie about what I saw.'
-        ],
-        'default': [
-          'Yes, that\'s correct.',
-          'No, that did not happen.',
-          'I don\'t recall those specific details.',
-          'To the best of my knowledge, yes.'
-        ]
-      },
-      'defendant': {
-        'testimony': [
-          'I did not commit the crimes I\'m charged with.',
-          'I was not at the location during the time in question.',
-          'I have been honest about my whereabouts that evening.',
-          'The identification is mistaken - it was not me.'
-        ],
-        'default': [
-          'Not guilty, your honor.',
-          'I understand my rights.',
-          'Yes, your honor.',
-          'No, your honor.'
-        ]
-      },
-      'plaintiff': {
-        'testimony': [
-          'The accident has completely changed my life.',
-          'I was not at fault for what happened.',
-          'The pain and suffering has been tremendous.',
-          'I just want to be made whole again.'
-        ],
-        'default': [
-          'Yes, that\'s exactly what happened.',
-          'The defendant was clearly negligent.',
-          'I\'ve suffered significant damages.',
-          'That is correct, your honor.'
-        ]
-      },
-      'jury-member': {
-        'default': ['[Listening attentively]', '[Taking notes]', '[Observing evidence]']
-      },
-      'bailiff': {
-        'default': ['All rise for the Honorable Judge.', 'Please be seated.', 'Order in the court.']
-      },
-      'court-clerk': {
-        'default': ['Case number called.', 'Exhibit marked for identification.', 'So noted by the court.']
-      },
-      'observer': {
-        'default': ['[Observing proceedings silently]']
-      }
-    };
-
-    const roleStatements = statements[this.participant.role] || { default: ['[No statement available]'] };
+    const roleStatements = DEFAULT_STATEMENTS[this.participant.role] || { default: ['[No statement available]'] };
     const contextualStatements = roleStatements[contextKey] || roleStatements.default || ['[No statement available]'];
     
     return contextualStatements[Math.floor(Math.random() * contextualStatements.length)];
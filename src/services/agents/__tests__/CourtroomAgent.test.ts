@@ -1,5 +1,6 @@
 import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
 import { CourtroomAgent } from '../CourtroomAgent';
+import { LLMProviderFactory } from '../../llm/LLMProvider';
 import type { Participant, Evidence } from '../../../types';
 
 describe('CourtroomAgent', () => {
@@ -39,6 +40,7 @@ describe('CourtroomAgent', () => {
 
   afterEach(() => {
     vi.clearAllMocks();
+    vi.restoreAllMocks();
   });
 
   describe('Constructor', () => {
@@ -250,6 +252,84 @@ describe('CourtroomAgent', () => {
       expect(summary).toContain('defense-attorney');
       expect(summary).toContain('Stanford Law');
     });
+
+    it('should cap long-term memory while keeping identity memories', async () => {
+      // Always archive items evicted from short-term memory
+      vi.spyOn(Math, 'random').mockReturnValue(0.9);
+
+      for (let i = 0; i < 120; i++) {
+        await agent.processEvidence({
+          id: `evidence-${i}`,
+          type: 'document',
+          title: `Exhibit ${i}`,
+          description: 'Bulk exhibit',
+          admissible: true,
+          submittedBy: 'prosecutor-1',
+          chainOfCustody: [],
+        });
+      }
+
+      const longTerm: string[] = (agent as any).memory.longTerm;
+      expect(longTerm.length).toBe(64);
+      expect(longTerm[0]).toBe('I am Test Attorney, a defense-attorney.');
+      expect(longTerm).toContain('I am motivated by: Due process');
+      expect(longTerm[longTerm.length - 1]).toBe('Evidence: Exhibit 99 - Bulk exhibit');
+    });
+
+    it('should keep archiving when identity memories fill the cap', async () => {
+      vi.spyOn(Math, 'random').mockReturnValue(0.9);
+
+      const motivations = Array.from({ length: 70 }, (_, i) => `Motivation ${i}`);
+      const busyAgent = new CourtroomAgent({
+        ...mockParticipant,
+        background: { ...mockParticipant.background, motivations },
+      });
+
+      for (let i = 0; i < 30; i++) {
+        await busyAgent.processEvidence({
+          id: `evidence-${i}`,
+          type: 'document',
+          title: `Exhibit ${i}`,
+          description: 'Bulk exhibit',
+          admissible: true,
+          submittedBy: 'prosecutor-1',
+          chainOfCustody: [],
+        });
+      }
+
+      const longTerm: string[] = (busyAgent as any).memory.longTerm;
+      // 3 identity lines + 70 motivations, plus the single most recent archived item
+      expect(longTerm.length).toBe(74);
+      expect(longTerm[longTerm.length - 1]).toBe('Evidence: Exhibit 9 - Bulk exhibit');
+    });
+  });
+
+  describe('LLM Provider Sharing', () => {
+    const ollamaConfig = { provider: 'ollama', model: 'llama2', endpoint: 'http://localhost:11434' };
+
+    afterEach(() => {
+      LLMProviderFactory.clearCache();
+    });
+
+    const createAIAgent = (id: string, llmProvider: any) =>
+      new CourtroomAgent({ ...mockParticipant, id, aiControlled: true, llmProvider });
+
+    it('should share one provider between agents with the same config', () => {
+      const first = createAIAgent('agent-a', { ...ollamaConfig });
+      const second = createAIAgent('agent-b', { ...ollamaConfig });
+
+      expect((first as any).llmProvider).not.toBeNull();
+      expect((first as any).llmProvider).toBe((second as any).llmProvider);
+    });
+
+    it('should create separate providers for different configs', () => {
+      const first = createAIAgent('agent-a', { ...ollamaConfig });
+      const otherModel = createAIAgent('agent-b', { ...ollamaConfig, model: 'mistral' });
+      const otherTemperature = createAIAgent('agent-c', { ...ollamaConfig, temperature: 0.2 });
+
+      expect((first as any).llmProvider).not.toBe((otherModel as any).llmProvider);
+      expect((first as any).llmProvider).not.toBe((otherTemperature as any).llmProvider);
+    });
   });
 
   describe('Role-Specific Behavior', () => {
@@ -17,6 +17,14 @@ export interface LLMResponse {
   };
 }
 
+// Persona/system text goes in Ollama's system field so the prompt prefix stays stable turn to turn
+function toOllamaPrompt(messages: LLMMessage[]): { system?: string; prompt: string } {
+  return {
+    system: messages.find(m => m.role === 'system')?.content,
+    prompt: messages.filter(m => m.role !== 'system').map(m => `${m.role}: ${m.content}`).join('\\n'),
+  };
+}
+
 export abstract class BaseLLMProvider {
   protected config: LLMConfig;
 
@@ -145,11 +153,12 @@ export class OllamaProvider extends BaseLLMProvider {
 
   async generateResponse(messages: LLMMessage[]): Promise<LLMResponse> {
     try {
-      const prompt = messages.map(m => `${m.role}: ${m.content}`).join('\\n');
+      const { system, prompt } = toOllamaPrompt(messages);
       
       const response = await this.client.generate({
         model: this.config.model || 'llama2',
         prompt: prompt,
+        system: system,
         options: {
           temperature: this.config.temperature || 0.7,
           num_predict: this.config.maxTokens || 1000,
@@ -288,20 +297,51 @@ export class GroqProvider extends BaseLLMProvider {
 }
 
 export class LLMProviderFactory {
+  // Agents with the same config share one provider (and its HTTP client / connection pool)
+  private static providers: Map<string, BaseLLMProvider> = new Map();
+
   static create(config: LLMConfig): BaseLLMProvider {
+    const key = [
+      config.provider,
+      config.model,
+      config.endpoint || 'default',
+      config.apiKey || '',
+      config.temperature,
+      config.maxTokens,
+    ].join('_');
+
+    const cached = this.providers.get(key);
+    if (cached) {
+      return cached;
+    }
+
+    let provider: BaseLLMProvider;
+
     switch (config.provider) {
       case 'openai':
-        return new OpenAIProvider(config);
+        provider = new OpenAIProvider(config);
+        break;
       case 'anthropic':
-        return new AnthropicProvider(config);
+        provider = new AnthropicProvider(config);
+        break;
       case 'ollama':
-        return new OllamaProvider(config);
+        provider = new OllamaProvider(config);
+        break;
       case 'openrouter':
-        return new OpenRouterProvider(config);
+        provider = new OpenRouterProvider(config);
+        break;
       case 'groq':
-        return new GroqProvider(config);
+        provider = new GroqProvider(config);
+        break;
       default:
         throw new Error(`Unsupported LLM provider: ${config.provider}`);
     }
+
+    this.providers.set(key, provider);
+    return provider;
   }
-}
\ No newline at end of file
+
+  static clearCache(): void {
+    this.providers.clear();
+  }
+}
@@ -0,0 +1,68 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { mapWithConcurrency, withTimeout } from '../async';
+
+describe('async utilities', () => {
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  describe('withTimeout', () => {
+    it('should clear its timer once the promise settles first', async () => {
+      vi.useFakeTimers();
+
+      const result = await withTimeout(Promise.resolve('done'), 10000, () => 'fallback');
+
+      expect(result).toBe('done');
+      expect(vi.getTimerCount()).toBe(0);
+    });
+
+    it('should clear its timer when the promise rejects first', async () => {
+      vi.useFakeTimers();
+
+      await expect(
+        withTimeout(Promise.reject(new Error('boom')), 10000, () => 'fallback')
+      ).rejects.toThrow('boom');
+      expect(vi.getTimerCount()).toBe(0);
+    });
+
+    it('should resolve with the fallback value on timeout', async () => {
+      vi.useFakeTimers();
+
+      const pending = withTimeout(new Promise<string>(() => {}), 10000, () => 'fallback');
+      await vi.advanceTimersByTimeAsync(10000);
+
+      await expect(pending).resolves.toBe('fallback');
+      expect(vi.getTimerCount()).toBe(0);
+    });
+
+    it('should reject when the timeout handler throws', async () => {
+      vi.useFakeTimers();
+
+      const pending = withTimeout(new Promise<string>(() => {}), 10000, () => {
+        throw new Error('Phase timeout');
+      });
+      const assertion = expect(pending).rejects.toThrow('Phase timeout');
+      await vi.advanceTimersByTimeAsync(10000);
+
+      await assertion;
+    });
+  });
+
+  describe('mapWithConcurrency', () => {
+    it('should keep input order and respect the limit', async () => {
+      let inFlight = 0;
+      let maxInFlight = 0;
+
+      const results = await mapWithConcurrency([30, 5, 20, 0, 10], 2, async (ms, index) => {
+        inFlight++;
+        maxInFlight = Math.max(maxInFlight, inFlight);
+        await new Promise(resolve => setTimeout(resolve, ms));
+        inFlight--;
+        return index;
+      });
+
+      expect(results).toEqual([0, 1, 2, 3, 4]);
+      expect(maxInFlight).toBe(2);
+    });
+  });
+});